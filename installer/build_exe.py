@@ -2,90 +2,366 @@
 
 from __future__ import annotations
 
-import argparse
+import hashlib
+import importlib.util
 import os
-import shutil
+import stat
 import sys
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+_SOURCE_DIR = _PROJECT_ROOT / "sda_local"
+_APP_ENTRY = _SOURCE_DIR / "app.py"
+_DIST_DIR = _PROJECT_ROOT / "dist"
+_BUILD_DIR = _PROJECT_ROOT / "build"
+_DATA_DIR = _SOURCE_DIR / "data"
+
+# Binaries that are known to break when compressed with UPX.
+_UPX_EXCLUDE = (
+    "vcruntime140.dll",
+    "vcruntime140_1.dll",
+    "python3.dll",
+    f"python{sys.version_info.major}{sys.version_info.minor}.dll",
+)
+
+# Standard library packages the app never imports. Excluding them keeps them
+# out of PyInstaller's module graph and binary classification pass. tkinter
+# is deliberately absent: the GUI is built on it.
+_EXCLUDES = (
+    "unittest",
+    "test",
+    "pydoc",
+    "pydoc_data",
+    "lib2to3",
+    "turtle",
+    "turtledemo",
+    "idlelib",
+    "distutils",
+)
 
 
 def _pyinstaller_available() -> bool:
-    try:
-        import PyInstaller  # type: ignore  # noqa: F401
-    except ModuleNotFoundError:
-        return False
-    return True
+    return importlib.util.find_spec("PyInstaller") is not None
 
 
-def _run_pyinstaller(args: List[str]) -> int:
-    try:
-        from PyInstaller.__main__ import run as run_pyinstaller
-    except ModuleNotFoundError as exc:  # pragma: no cover - handled by caller
-        raise RuntimeError("PyInstaller is not available") from exc
+def _run_pyinstaller(args: List[str], env: Optional[Dict[str, str]] = None) -> int:
+    """Run PyInstaller in a fresh ``python -OO`` interpreter."""
 
-    run_pyinstaller(args)
+    import subprocess
+
+    try:
+        subprocess.run([sys.executable, "-OO", "-m", "PyInstaller", *args], check=True, env=env)
+    except subprocess.CalledProcessError as exc:
+        raise RuntimeError(f"PyInstaller failed with exit status {exc.returncode}") from exc
     return 0
 
 
-def build(name: str = "sdaLocal", onefile: bool = True) -> Path:
-    """Build the executable using PyInstaller and return the output path."""
+def _handle_remove_error(func: Callable[[str], Any], path: str, error: BaseException) -> None:
+    """Ignore paths that are already gone and retry read-only files on Windows.
+
+    PyInstaller occasionally leaves read-only files behind; clearing the flag
+    lets the deletion go through instead of leaking them.
+    """
+
+    if isinstance(error, FileNotFoundError):
+        return
+    if sys.platform.startswith("win") and not os.access(path, os.W_OK):
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+        return
+    raise error
+
+
+def _remove_tree(path: Path) -> None:
+    """Delete ``path`` whether it is a directory or a single file."""
+
+    import shutil
+
+    if not path.is_dir() or path.is_symlink():
+        path.unlink(missing_ok=True)
+    elif sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_handle_remove_error)
+    else:  # onerror is deprecated from 3.12 and passes exc_info instead.
+        shutil.rmtree(path, onerror=lambda func, failed, exc_info: _handle_remove_error(func, failed, exc_info[1]))
+
+
+def _remove_trees(paths: Iterable[Path]) -> None:
+    """Delete the given paths, concurrently when there is more than one."""
+
+    paths = list(paths)
+    if len(paths) < 2:
+        for path in paths:
+            _remove_tree(path)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        futures = [executor.submit(_remove_tree, path) for path in paths]
+        for future in futures:
+            future.result()
+
+
+def _iter_source_stats(root: Path) -> Iterator[Tuple[str, int, int]]:
+    """Yield ``(relative path, mtime, size)`` for every file below ``root``."""
+
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        pending.append(Path(entry.path))
+                    continue
+                info = entry.stat()
+                yield os.path.relpath(entry.path, root), info.st_mtime_ns, info.st_size
+
+
+def _source_digest(*options: str) -> str:
+    """Fingerprint the application sources together with the build configuration."""
+
+    digest = hashlib.blake2b(repr(options).encode("utf-8"), digest_size=16)
+    for item in sorted(_iter_source_stats(_SOURCE_DIR)):
+        digest.update(repr(item).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _pack_data_archive(source: Path, target: Path) -> None:
+    """Bundle ``source`` into a single uncompressed zip so PyInstaller copies one file."""
+
+    import zipfile
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_STORED) as archive:
+        for path in sorted(source.rglob("*")):
+            if path.is_file():
+                archive.write(path, path.relative_to(source).as_posix())
+
+
+def _pyinstaller_config_dir(name: str) -> Path:
+    """Return a cache directory private to builds of ``name`` on this host.
+
+    Concurrent builds with different names no longer share (and corrupt) one
+    cache, while repeated builds of the same name still reuse theirs.
+    """
+
+    import platform
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / f"pyinstaller-{platform.node() or 'localhost'}-{name}"
+
+
+def _data_archive(name: str) -> Path:
+    # Kept beside the spec rather than inside build/<name>, which
+    # PyInstaller empties when --clean is passed.
+    return _BUILD_DIR / f"{name}.data.zip"
+
+
+def _render_spec(name: str, onefile: bool, upx: bool = False) -> str:
+    """Return the PyInstaller spec for ``name``.
 
-    project_root = Path(__file__).resolve().parents[1]
-    app_entry = project_root / "sda_local" / "app.py"
-    dist_dir = project_root / "dist"
-    build_dir = project_root / "build"
+    The output only depends on the arguments and the module constants, so an
+    unchanged configuration produces a byte-identical spec between runs.
+    """
+
+    # (source, destination) pairs for Analysis(datas=...). Paths are handed to
+    # PyInstaller as-is instead of an os.pathsep-joined --add-data string, so
+    # they may safely contain ':' or ';'.
+    datas = [(str(_data_archive(name)), "sda_local")]
+    analysis = f"""# Generated by installer/build_exe.py; edits are overwritten.
+a = Analysis(
+    [{str(_APP_ENTRY)!r}],
+    datas={datas!r},
+    excludes={list(_EXCLUDES)!r},
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+"""
+    if onefile:
+        return analysis + f"""exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name={name!r},
+    debug=False,
+    strip=False,
+    upx=False,
+    runtime_tmpdir=None,
+    console=False,
+)
+"""
+    return analysis + f"""exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={name!r},
+    debug=False,
+    strip=False,
+    upx={upx!r},
+    upx_exclude={list(_UPX_EXCLUDE)!r},
+    console=False,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx={upx!r},
+    upx_exclude={list(_UPX_EXCLUDE)!r},
+    name={name!r},
+)
+"""
+
+
+def _ensure_spec(path: Path, content: str) -> None:
+    """Write the spec only when it changed so PyInstaller's cached analysis stays valid."""
+
+    if path.exists() and path.read_text(encoding="utf-8") == content:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def _stamp_file(name: str, onefile: bool) -> Path:
+    """Return the build stamp for one target, so each name and mode keeps its own."""
+
+    return _DIST_DIR / f".{name}{'.onefile' if onefile else ''}.build_stamp"
+
+
+def _output_path(name: str, onefile: bool) -> Path:
+    """Return what a build of ``name`` writes under ``dist/``: a file or a folder."""
+
+    if onefile:
+        return _expected_exe_path(name, onefile)
+    return _DIST_DIR / name
+
+
+def _expected_exe_path(name: str, onefile: bool) -> Path:
+    # PyInstaller only appends ".exe" when building on Windows.
+    executable = f"{name}.exe" if sys.platform.startswith("win") else name
+    if onefile:
+        return _DIST_DIR / executable
+    return _DIST_DIR / name / executable
+
+
+def build(
+    name: str = "sdaLocal",
+    onefile: bool = False,
+    clean: bool = False,
+    force: bool = False,
+    upx_dir: Optional[Path] = None,
+) -> Path:
+    """Build the executable using PyInstaller and return the output path.
+
+    The PyInstaller work directory is kept between runs so unchanged modules
+    are not re-analysed. Pass ``clean=True`` to force a build from scratch.
+    When nothing under ``sda_local/`` changed since the last successful build
+    the existing executable is returned as-is unless ``force`` is set.
+
+    Each build only replaces its own output, work files, data archive and
+    stamp, so builds with different ``name`` values can run concurrently.
+
+    Folder-based builds are compressed with UPX when ``upx_dir`` is given.
+    Single-file builds never are: the bootloader already compresses its
+    payload and stacking both slows every launch.
+    """
 
     if not _pyinstaller_available():
         raise SystemExit(
             "PyInstaller is required to build the executable. Install it with 'pip install pyinstaller'."
         )
 
-    if build_dir.exists():
-        shutil.rmtree(build_dir)
-    if dist_dir.exists():
-        shutil.rmtree(dist_dir)
-
-    add_data_arg = f"{project_root / 'sda_local' / 'data'}{os.pathsep}sda_local/data"
+    for required, label in ((_APP_ENTRY, "App entry"), (_DATA_DIR, "Data directory")):
+        try:
+            required.stat()
+        except FileNotFoundError:
+            raise SystemExit(f"{label} not found: {required}") from None
 
-    pyinstaller_args: List[str] = [
-        str(app_entry),
-        "--name",
-        name,
+    spec_path = _BUILD_DIR / f"{name}.spec"
+    use_upx = upx_dir is not None and not onefile
+    spec = _render_spec(name, onefile, upx=use_upx)
+    pyinstaller_args: Tuple[str, ...] = (
+        str(spec_path),
         "--noconfirm",
-        "--clean",
-        "--windowed",
-        "--add-data",
-        add_data_arg,
-    ]
+        "--distpath",
+        str(_DIST_DIR),
+        "--workpath",
+        str(_BUILD_DIR),
+    ) + (("--upx-dir", str(upx_dir)) if use_upx else ())
 
-    if onefile:
-        pyinstaller_args.append("--onefile")
+    exe_path = _expected_exe_path(name, onefile)
+    stamp_file = _stamp_file(name, onefile)
+    digest = _source_digest(spec, *pyinstaller_args)
+    if not (force or clean) and exe_path.exists() and stamp_file.exists():
+        if stamp_file.read_text(encoding="utf-8") == digest:
+            return exe_path
 
-    _run_pyinstaller(pyinstaller_args)
+    # Only this target's output and work files are touched, so builds of
+    # other names can run from the same checkout at the same time.
+    output_path = _output_path(name, onefile)
+    _remove_trees([_BUILD_DIR / name, output_path] if clean else [output_path])
+    _pack_data_archive(_DATA_DIR, _data_archive(name))
+    _ensure_spec(spec_path, spec)
+
+    env = dict(os.environ, PYINSTALLER_CONFIG_DIR=str(_pyinstaller_config_dir(name)))
+    _run_pyinstaller(list(pyinstaller_args + (("--clean",) if clean else ())), env=env)
 
-    if onefile:
-        exe_path = dist_dir / f"{name}.exe"
-    else:
-        exe_path = dist_dir / name / f"{name}.exe"
     if not exe_path.exists():
         raise FileNotFoundError(f"Expected executable not found at {exe_path}")
+    stamp_file.write_text(digest, encoding="utf-8")
 
     return exe_path
 
 
 def main(argv: List[str] | None = None) -> int:
+    import argparse
+    import shutil
+
     parser = argparse.ArgumentParser(description="Build a Windows executable using PyInstaller.")
     parser.add_argument("--name", default="sdaLocal", help="Name of the generated executable.")
     parser.add_argument(
-        "--onedir",
+        "--onefile",
+        action="store_true",
+        help=(
+            "Build a single-file executable instead of a folder-based distribution. "
+            "The file is easier to share but unpacks itself on every launch, so it starts slower."
+        ),
+    )
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help="Discard cached build artifacts and rebuild everything from scratch.",
+    )
+    parser.add_argument(
+        "--force",
         action="store_true",
-        help="Build a folder-based distribution instead of a single-file executable.",
+        help="Rebuild even when the sources have not changed since the last build.",
+    )
+    parser.add_argument(
+        "--upx-dir",
+        type=Path,
+        default=None,
+        help="Directory containing the UPX executable. Defaults to the 'upx' found on PATH, if any.",
     )
     parsed = parser.parse_args(argv)
 
+    upx_dir = parsed.upx_dir
+    if upx_dir is None:
+        upx_executable = shutil.which("upx")
+        upx_dir = Path(upx_executable).parent if upx_executable else None
+
     try:
-        exe_path = build(name=parsed.name, onefile=not parsed.onedir)
+        exe_path = build(
+            name=parsed.name,
+            onefile=parsed.onefile,
+            clean=parsed.clean,
+            force=parsed.force,
+            upx_dir=upx_dir,
+        )
     except (SystemExit, RuntimeError, FileNotFoundError) as exc:
         print(exc)
         return 1
@@ -12,19 +12,29 @@ The application provides the following features:
 
 from __future__ import annotations
 
+import bisect
 import json
+import math
 import os
 import sys
 import tkinter as tk
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from tkinter import messagebox
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+import weakref
 import webbrowser
+from collections import deque
 
 from tkinter import ttk
 
+try:  # Optional: a faster JSON encoder. The standard library is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
 
 
 def _determine_data_dir() -> Path:
@@ -45,32 +55,116 @@ def _determine_data_dir() -> Path:
 
 DATA_DIR = _determine_data_dir()
 DATA_FILE = DATA_DIR / "sdalocal_data.json"
+CHAT_FILE = DATA_DIR / "chat.jsonl"
+SAVE_DELAY_MS = 500
+
+# Tcl lambda that inserts a flat list of ``iid values`` pairs into a Treeview,
+# so populating a tree at startup costs one Tcl call rather than one per row.
+# An empty iid lets Tk generate one.
+_TREE_BULK_INSERT = (
+    "{tree rows} {foreach {iid values} $rows {"
+    "if {$iid eq {}} {$tree insert {} end -values $values} "
+    "else {$tree insert {} end -id $iid -values $values}}}"
+)
+
+# Tcl lambda that configures a menu with a flat ``-option value`` list and
+# returns the submenu paths of its cascade entries, so styling a menu costs
+# one call rather than a configure plus type and entrycget queries per entry.
+_MENU_STYLE = (
+    "{menu options} {$menu configure {*}$options; set cascades {}; set last [$menu index end]; "
+    "if {$last ni {none {}}} {for {set i 0} {$i <= $last} {incr i} {"
+    "if {[$menu type $i] eq {cascade}} {lappend cascades [$menu entrycget $i -menu]}}}; "
+    "return $cascades}"
+)
+
+
+def _decode_json(raw: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed.
+
+    orjson rejects the ``Infinity``/``NaN`` literals that ``json.dumps`` may
+    have written, so anything it refuses is retried with the standard library
+    before the data is treated as corrupted.
+    """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _event_sort_key(event: Dict[str, Any]) -> Tuple[str, str]:
+    return (event["date"], event["title"])
+
+
+def _encode_json(value: Any) -> bytes:
+    """Serialize ``value`` to compact JSON bytes, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    """Serialize a stored record, leaving out its ``_``-prefixed display caches."""
+
+    persisted = {key: value for key, value in record.items() if not key.startswith("_")}
+    if orjson is not None and any(type(value) is float and not math.isfinite(value) for value in persisted.values()):
+        # orjson writes non-finite floats as null, which the next load cannot
+        # total; keep the Infinity/NaN literals older versions saved.
+        return json.dumps(persisted, separators=(",", ":")).encode("utf-8")
+    return _encode_json(persisted)
+
+
+def _encode_chat_line(message: Dict[str, Any]) -> bytes:
+    """Return ``message`` as one JSON Lines record for the chat log."""
+
+    return _encode_json(message) + b"\n"
 
 
 @dataclass
 class Event:
     """Data model representing a bulletin event."""
 
+    __slots__ = ("title", "date", "description")
+
     title: str
     date: str
     description: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"title": self.title, "date": self.date, "description": self.description}
+
 
 @dataclass
 class FinanceEntry:
     """Data model representing a financial record."""
 
+    __slots__ = ("entry_type", "amount", "category", "note", "created_at")
+
     entry_type: str
     amount: float
     category: str
     note: str
     created_at: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entry_type": self.entry_type,
+            "amount": self.amount,
+            "category": self.category,
+            "note": self.note,
+            "created_at": self.created_at,
+        }
+
 
 @dataclass
 class Project:
     """Data model representing a church building project."""
 
+    __slots__ = ("name", "manager", "start_date", "end_date", "budget", "status", "description")
+
     name: str
     manager: str
     start_date: str
@@ -79,10 +173,198 @@ class Project:
     status: str
     description: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "manager": self.manager,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "budget": self.budget,
+            "status": self.status,
+            "description": self.description,
+        }
+
+
+class Palette(NamedTuple):
+    """Colours used by one of the custom themes."""
+
+    background: str
+    frame: str
+    foreground: str
+    input: str
+    input_fg: str
+    accent: str
+    tree_background: str
+    tree_field: str
+    tree_foreground: str
+    border: str
+
+
+# Colour palettes for the custom ttk themes, keyed by theme name. The
+# registry is read-only so a palette name always means the same colours,
+# which is what lets _build_ttk_spec cache by name.
+PALETTES: Mapping[str, Palette] = MappingProxyType({
+    "sdalocal-light": Palette(
+        background="#f0f0f0",
+        frame="#ffffff",
+        foreground="#202020",
+        input="#ffffff",
+        input_fg="#202020",
+        accent="#2c6bed",
+        tree_background="#ffffff",
+        tree_field="#f5f5f5",
+        tree_foreground="#202020",
+        border="#cccccc",
+    ),
+    "sdalocal-dark": Palette(
+        background="#1e1e1e",
+        frame="#2b2b2b",
+        foreground="#f5f5f5",
+        input="#3c3c3c",
+        input_fg="#f5f5f5",
+        accent="#3b82f6",
+        tree_background="#2b2b2b",
+        tree_field="#1f1f1f",
+        tree_foreground="#f5f5f5",
+        border="#4a4a4a",
+    ),
+})
+
+
+@lru_cache(maxsize=8)
+def _build_ttk_spec(theme_name: str) -> Dict[str, Any]:
+    """Return the ttk ``theme_create`` settings for the palette ``theme_name``.
+
+    Results are memoized per theme name, so the nested settings are only
+    assembled once per palette.
+    """
+
+    palette = PALETTES[theme_name]
+    # Editable and read-only comboboxes share one colour per option.
+    input_field_map = [("readonly", palette.input), ("!disabled", palette.input)]
+    input_text_map = [("readonly", palette.input_fg), ("!disabled", palette.input_fg)]
+    return {
+        "TFrame": {"configure": {"background": palette.frame, "foreground": palette.foreground}},
+        "TLabelframe": {"configure": {"background": palette.frame, "foreground": palette.foreground, "bordercolor": palette.border}},
+        "TLabelframe.Label": {"configure": {"background": palette.frame, "foreground": palette.foreground}},
+        "TLabel": {"configure": {"background": palette.frame, "foreground": palette.foreground}},
+        "TButton": {
+            "configure": {"background": palette.frame, "foreground": palette.foreground},
+            "map": {
+                "background": [("active", palette.accent)],
+                "foreground": [("active", palette.foreground)],
+            },
+        },
+        "TNotebook": {"configure": {"background": palette.background, "bordercolor": palette.border}},
+        "TNotebook.Tab": {
+            "configure": {
+                "background": palette.frame,
+                "foreground": palette.foreground,
+                "padding": (10, 5),
+            },
+            "map": {
+                "background": [("selected", palette.accent)],
+                "foreground": [("selected", palette.foreground)],
+            },
+        },
+        "TEntry": {
+            "configure": {
+                "fieldbackground": palette.input,
+                "foreground": palette.input_fg,
+                "background": palette.frame,
+                "insertcolor": palette.input_fg,
+            }
+        },
+        "TCombobox": {
+            "configure": {
+                "fieldbackground": palette.input,
+                "foreground": palette.input_fg,
+                "background": palette.frame,
+            },
+            "map": {"fieldbackground": input_field_map, "foreground": input_text_map},
+        },
+        "Treeview": {
+            "configure": {
+                "background": palette.tree_background,
+                "fieldbackground": palette.tree_field,
+                "foreground": palette.tree_foreground,
+                "bordercolor": palette.border,
+            },
+            "map": {
+                "background": [("selected", palette.accent)],
+                "foreground": [("selected", palette.foreground)],
+            },
+        },
+        "Treeview.Heading": {
+            "configure": {"background": palette.frame, "foreground": palette.foreground}
+        },
+    }
+
+
+def _build_text_widget_options(palette: Palette) -> Dict[str, str]:
+    """Return the ``configure`` options that style a classic Text widget."""
+
+    return {
+        "bg": palette.input,
+        "fg": palette.input_fg,
+        "insertbackground": palette.input_fg,
+        "highlightbackground": palette.border,
+        "highlightcolor": palette.border,
+        "selectbackground": palette.accent,
+        "selectforeground": palette.foreground,
+    }
+
+
+def _build_palette_options(palette: Palette) -> Dict[str, str]:
+    """Return the ``tk_setPalette`` options for classic Tk widgets."""
+
+    return {
+        "background": palette.frame,
+        "foreground": palette.foreground,
+        "activeBackground": palette.accent,
+        "activeForeground": palette.foreground,
+        "highlightColor": palette.border,
+        "selectBackground": palette.accent,
+        "selectForeground": palette.foreground,
+        "insertBackground": palette.input_fg,
+    }
+
+
+def _build_menu_options(palette: Palette) -> Tuple[str, ...]:
+    """Return the flat ``-option value`` list that styles a classic Menu."""
+
+    return (
+        "-background", palette.frame,
+        "-foreground", palette.foreground,
+        "-activebackground", palette.accent,
+        "-activeforeground", palette.foreground,
+        "-bd", "0",
+        "-relief", tk.FLAT,
+    )
+
 
 class SDALocalApp(tk.Tk):
     """Main application window for the sdaLocal desktop experience."""
 
+    # tk.Tk instances keep their __dict__, but the attributes read on every
+    # theme switch get slot descriptors for cheaper access.
+    __slots__ = (
+        "style",
+        "dark_mode",
+        "_text_widgets",
+        "_current_theme",
+        "_palette_version",
+        "_styled_menus",
+        "_menubar",
+    )
+
+    # Built once at import. The specs are shared through _build_ttk_spec's
+    # cache, so they are exposed read-only.
+    _compiled_styles = MappingProxyType({name: MappingProxyType(_build_ttk_spec(name)) for name in PALETTES})
+    _text_widget_options = {name: _build_text_widget_options(palette) for name, palette in PALETTES.items()}
+    _palette_options = {name: _build_palette_options(palette) for name, palette in PALETTES.items()}
+    _menu_options = {name: _build_menu_options(palette) for name, palette in PALETTES.items()}
+
     def __init__(self) -> None:
         super().__init__()
         self.title("sdaLocal")
@@ -96,30 +378,17 @@ class SDALocalApp(tk.Tk):
             self.style.theme_use("clam")
         self.dark_mode = tk.BooleanVar(value=False)
         self._text_widgets: List[tk.Text] = []
-        self._light_palette = {
-            "background": "#f0f0f0",
-            "frame": "#ffffff",
-            "foreground": "#202020",
-            "input": "#ffffff",
-            "input_fg": "#202020",
-            "accent": "#2c6bed",
-            "tree_background": "#ffffff",
-            "tree_field": "#f5f5f5",
-            "tree_foreground": "#202020",
-            "border": "#cccccc",
-        }
-        self._dark_palette = {
-            "background": "#1e1e1e",
-            "frame": "#2b2b2b",
-            "foreground": "#f5f5f5",
-            "input": "#3c3c3c",
-            "input_fg": "#f5f5f5",
-            "accent": "#3b82f6",
-            "tree_background": "#2b2b2b",
-            "tree_field": "#1f1f1f",
-            "tree_foreground": "#f5f5f5",
-            "border": "#4a4a4a",
-        }
+        self._save_pending: Optional[str] = None
+        # Encoded records of each category, joined by commas, reused between
+        # saves. A category is re-encoded only after it is dropped from here.
+        self._serialized: Dict[str, bytearray] = {}
+        self._current_theme: Optional[str] = None
+        # Bumped on every theme change; _styled_menus records the version
+        # each menu was last styled with.
+        self._palette_version = 0
+        self._styled_menus: "weakref.WeakKeyDictionary[tk.Menu, int]" = weakref.WeakKeyDictionary()
+        self._today_date: Optional[date] = None
+        self._today_text = ""
 
         self._setup_custom_themes()
 
@@ -136,42 +405,185 @@ class SDALocalApp(tk.Tk):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-        self._build_events_tab()
-        self._build_finance_tab()
-        self._build_media_tab()
-        self._build_projects_tab()
+        # Only the first tab is built up front; the others are filled in the
+        # first time they are selected.
+        self._tab_builders: Dict[str, Callable[[ttk.Frame], None]] = {}
+        for text, builder in (
+            ("Bulletin Events", self._build_events_tab),
+            ("Income & Expenses", self._build_finance_tab),
+            ("Media & Chat", self._build_media_tab),
+            ("Building Projects", self._build_projects_tab),
+        ):
+            tab = ttk.Frame(self.notebook)
+            self.notebook.add(tab, text=text)
+            self._tab_builders[str(tab)] = builder
+        self._build_selected_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._build_selected_tab)
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         self._apply_theme()
 
+    def _build_selected_tab(self, _: Optional[tk.Event] = None) -> None:
+        tab_name = str(self.notebook.select())
+        builder = self._tab_builders.pop(tab_name, None)
+        if builder is not None:
+            builder(self.nametowidget(tab_name))
+
+    def _today(self) -> str:
+        """Return today's date as YYYY-MM-DD, formatting it only when the day changes."""
+
+        today = date.today()
+        if today != self._today_date:
+            self._today_date = today
+            self._today_text = today.isoformat()
+        return self._today_text
+
     # ------------------------------------------------------------------
     # Data handling
     # ------------------------------------------------------------------
     def _load_data(self) -> None:
-        if DATA_FILE.exists():
+        raw = DATA_FILE.read_bytes() if DATA_FILE.exists() else b""
+        if raw.strip():  # An empty file simply means there is nothing saved yet.
             try:
-                self.data = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+                self.data = _decode_json(raw)
             except json.JSONDecodeError:
                 messagebox.showwarning(
                     "Data error",
                     "Existing data file is corrupted. Starting with a fresh set of records.",
                 )
                 self.data = {"events": [], "finance": [], "projects": [], "chat": []}
+        # Normalize and sort records before _load_chat, which may save and
+        # so cache their encoded form.
+        self._recalculate_finance_totals()
+        self._rebuild_indexes()
+        self._load_chat()
+
+    def _load_chat(self) -> None:
+        """Read the chat log, moving messages stored by older versions into it first."""
+
+        raw = CHAT_FILE.read_bytes() if CHAT_FILE.exists() else b""
+        if raw and not raw.endswith(b"\n"):
+            # Terminate a line cut short by a crash so the next message
+            # appended by _append_chat starts on a line of its own.
+            raw += b"\n"
+            with CHAT_FILE.open("ab") as chat_file:
+                chat_file.write(b"\n")
+
+        legacy_chat = self.data.pop("chat", None) or []
+        if legacy_chat:
+            moved = b"".join(_encode_chat_line(message) for message in legacy_chat)
+            # The log is swapped in atomically, so it either holds all of the
+            # moved messages or none. If a previous start moved them but did
+            # not get to save the data file, they are not copied again.
+            if not raw.endswith(moved):
+                raw += moved
+                tmp_file = CHAT_FILE.with_suffix(".jsonl.tmp")
+                tmp_file.write_bytes(raw)
+                os.replace(tmp_file, CHAT_FILE)
+            self._save_data()
+
+        chat: List[Dict[str, Any]] = []
+        for line in raw.splitlines():
+            try:
+                chat.append(_decode_json(line))
+            except ValueError:
+                # A line cut short by a crash, possibly mid-character (a
+                # UnicodeDecodeError); the rest is still usable.
+                continue
+        self.data["chat"] = chat
+
+    def _rebuild_indexes(self) -> None:
+        # Events are kept ordered by (date, title) so the bulletin reads in
+        # date order; _event_keys mirrors that order for bisect lookups.
+        events = self.data.setdefault("events", [])
+        events.sort(key=_event_sort_key)
+        self._event_keys: List[Tuple[str, str]] = []
+        self._events_by_iid: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            event["_iid"] = event["title"] + event["date"]
+            self._event_keys.append(_event_sort_key(event))
+            self._events_by_iid[event["_iid"]] = event
+        self._projects_by_name: Dict[str, Dict[str, Any]] = {
+            project["name"]: project for project in self.data.get("projects", [])
+        }
+
+    def _recalculate_finance_totals(self) -> None:
+        self._income_total = 0.0
+        self._expense_total = 0.0
+        for entry in self.data.get("finance", []):
+            entry["entry_type"] = entry["entry_type"].title()
+            if entry["entry_type"] == "Income":
+                self._income_total += entry["amount"]
+            elif entry["entry_type"] == "Expense":
+                self._expense_total += entry["amount"]
 
     def _save_data(self) -> None:
-        DATA_FILE.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+        # Write to a sibling file and swap it in so a crash never leaves a
+        # half-written data file behind. The cached fragments are streamed
+        # through one large buffer rather than joined into a single payload,
+        # so saving never holds a second copy of the whole document.
+        tmp_file = DATA_FILE.with_suffix(".json.tmp")
+        with open(tmp_file, "wb", buffering=1 << 20) as handle:
+            handle.write(b"{")
+            separator = b""
+            for category, records in self.data.items():
+                if category == "chat":  # Appended to CHAT_FILE as messages are sent.
+                    continue
+                fragment = self._serialized.get(category)
+                if fragment is None:
+                    fragment = self._serialized[category] = bytearray(b",".join(map(_encode_record, records)))
+                handle.write(separator + _encode_json(category) + b":[")
+                handle.write(fragment)
+                handle.write(b"]")
+                separator = b","
+            handle.write(b"}")
+        os.replace(tmp_file, DATA_FILE)
+
+    def _schedule_save(self, category: str, appended: Optional[Dict[str, Any]] = None) -> None:
+        """Record a change to ``category`` and save it shortly afterwards.
+
+        Pass ``appended`` when the only change is a record added to the end of
+        the list; its encoding is then appended to the cached fragment instead
+        of re-encoding the whole category. A burst of changes is coalesced
+        into a single save.
+        """
+
+        fragment = self._serialized.get(category)
+        if appended is not None and fragment is not None:
+            if fragment:
+                fragment += b","
+            fragment += _encode_record(appended)
+        else:
+            self._serialized.pop(category, None)
+
+        if self._save_pending is None:
+            self._save_pending = self.after(SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self) -> None:
+        self._save_pending = None
+        self._save_data()
 
     def _on_close(self) -> None:
+        if self._save_pending is not None:
+            self.after_cancel(self._save_pending)
+            self._save_pending = None
         self._save_data()
         self.destroy()
 
+    def _populate_tree(self, tree: ttk.Treeview, rows: Iterable[Tuple[str, Tuple[str, ...]]]) -> None:
+        """Insert ``(iid, values)`` rows into ``tree`` with a single Tcl call."""
+
+        flattened: List[Any] = []
+        for iid, values in rows:
+            flattened.append(iid)
+            flattened.append(values)
+        if flattened:
+            self.tk.call("apply", _TREE_BULK_INSERT, str(tree), tuple(flattened))
+
     # ------------------------------------------------------------------
     # Bulletin events tab
     # ------------------------------------------------------------------
-    def _build_events_tab(self) -> None:
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Bulletin Events")
-
+    def _build_events_tab(self, tab: ttk.Frame) -> None:
         form_frame = ttk.LabelFrame(tab, text="Create Event")
         form_frame.pack(fill=tk.X, padx=10, pady=10)
 
@@ -183,7 +595,7 @@ class SDALocalApp(tk.Tk):
             row=0, column=2, sticky=tk.W, padx=5, pady=5
         )
         self.event_date = ttk.Entry(form_frame)
-        self.event_date.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.event_date.insert(0, self._today())
         self.event_date.grid(row=0, column=3, sticky=tk.EW, padx=5, pady=5)
 
         ttk.Label(form_frame, text="Description").grid(row=1, column=0, sticky=tk.NW, padx=5, pady=5)
@@ -216,8 +628,10 @@ class SDALocalApp(tk.Tk):
         self._register_text_widget(self.event_details)
         self.event_details.pack(fill=tk.X, padx=5, pady=5)
 
-        for event in self.data.get("events", []):
-            self._insert_event_row(event)
+        self._populate_tree(
+            self.events_tree,
+            [(event["_iid"], self._event_row_values(event)) for event in self.data.get("events", [])],
+        )
 
     def _add_event(self) -> None:
         title = self.event_title.get().strip()
@@ -229,22 +643,31 @@ class SDALocalApp(tk.Tk):
             return
 
         try:
-            datetime.strptime(date_text, "%Y-%m-%d")
+            date_text = date.fromisoformat(date_text).isoformat()
         except ValueError:
             messagebox.showerror("Invalid Date", "Date must be in YYYY-MM-DD format.")
             return
 
-        event = asdict(Event(title=title, date=date_text, description=description))
-        self.data.setdefault("events", []).append(event)
-        self._insert_event_row(event)
+        event = Event(title=title, date=date_text, description=description).to_dict()
+        key = _event_sort_key(event)
+        position = bisect.bisect_right(self._event_keys, key)
+        self._event_keys.insert(position, key)
+        events = self.data["events"]
+        events.insert(position, event)
+        event["_iid"] = event["title"] + event["date"]
+        self._events_by_iid[event["_iid"]] = event
+        self._insert_event_row(event, position)
         self.event_title.delete(0, tk.END)
         self.event_description.delete("1.0", tk.END)
         self.event_date.delete(0, tk.END)
-        self.event_date.insert(0, datetime.now().strftime("%Y-%m-%d"))
-        self._save_data()
+        self.event_date.insert(0, self._today())
+        self._schedule_save("events", appended=event if position == len(events) - 1 else None)
+
+    def _event_row_values(self, event: Dict[str, Any]) -> Tuple[str, ...]:
+        return (event["date"], event["title"])
 
-    def _insert_event_row(self, event: Dict[str, Any]) -> None:
-        self.events_tree.insert("", tk.END, values=(event["date"], event["title"]), iid=event["title"] + event["date"])
+    def _insert_event_row(self, event: Dict[str, Any], index: Any = tk.END) -> None:
+        self.events_tree.insert("", index, values=self._event_row_values(event), iid=event["_iid"])
 
     def _delete_event(self) -> None:
         selected = self.events_tree.selection()
@@ -252,35 +675,33 @@ class SDALocalApp(tk.Tk):
             messagebox.showinfo("No selection", "Please choose an event to delete.")
             return
         iid = selected[0]
-        values = self.events_tree.item(iid)["values"]
         self.events_tree.delete(iid)
-        self.data["events"] = [event for event in self.data["events"] if not (event["date"] == values[0] and event["title"] == values[1])]
+        event = self._events_by_iid.pop(iid, None)
+        if event is not None:
+            position = bisect.bisect_left(self._event_keys, _event_sort_key(event))
+            del self._event_keys[position]
+            del self.data["events"][position]
         self.event_details.configure(state=tk.NORMAL)
         self.event_details.delete("1.0", tk.END)
         self.event_details.configure(state=tk.DISABLED)
-        self._save_data()
+        self._schedule_save("events")
 
     def _show_event_details(self, _: tk.Event) -> None:
         selected = self.events_tree.selection()
         if not selected:
             return
-        iid = selected[0]
-        values = self.events_tree.item(iid)["values"]
-        for event in self.data.get("events", []):
-            if event["date"] == values[0] and event["title"] == values[1]:
-                self.event_details.configure(state=tk.NORMAL)
-                self.event_details.delete("1.0", tk.END)
-                self.event_details.insert(tk.END, f"Title: {event['title']}\nDate: {event['date']}\n\n{event['description']}")
-                self.event_details.configure(state=tk.DISABLED)
-                break
+        event = self._events_by_iid.get(selected[0])
+        if not event:
+            return
+        self.event_details.configure(state=tk.NORMAL)
+        self.event_details.delete("1.0", tk.END)
+        self.event_details.insert(tk.END, f"Title: {event['title']}\nDate: {event['date']}\n\n{event['description']}")
+        self.event_details.configure(state=tk.DISABLED)
 
     # ------------------------------------------------------------------
     # Finance tab
     # ------------------------------------------------------------------
-    def _build_finance_tab(self) -> None:
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Income & Expenses")
-
+    def _build_finance_tab(self, tab: ttk.Frame) -> None:
         form_frame = ttk.LabelFrame(tab, text="Log Transaction")
         form_frame.pack(fill=tk.X, padx=10, pady=10)
 
@@ -322,8 +743,9 @@ class SDALocalApp(tk.Tk):
         self.finance_summary = ttk.Label(tab, text="")
         self.finance_summary.pack(anchor=tk.E, padx=15, pady=(0, 10))
 
-        for entry in self.data.get("finance", []):
-            self._insert_finance_row(entry)
+        self._populate_tree(
+            self.finance_tree, [("", self._finance_row_values(entry)) for entry in self.data.get("finance", [])]
+        )
         self._update_finance_summary()
 
     def _add_finance_entry(self) -> None:
@@ -338,43 +760,47 @@ class SDALocalApp(tk.Tk):
             messagebox.showerror("Invalid amount", "Please enter a numeric value for the amount.")
             return
 
+        if not math.isfinite(amount):
+            messagebox.showerror("Invalid amount", "Please enter a numeric value for the amount.")
+            return
+
         if amount <= 0:
             messagebox.showerror("Invalid amount", "Amount must be greater than zero.")
             return
 
         created_at = datetime.now().strftime("%Y-%m-%d %H:%M")
-        entry = asdict(
-            FinanceEntry(
-                entry_type=entry_type,
-                amount=amount,
-                category=category,
-                note=note,
-                created_at=created_at,
-            )
-        )
+        entry = FinanceEntry(
+            entry_type=entry_type,
+            amount=amount,
+            category=category,
+            note=note,
+            created_at=created_at,
+        ).to_dict()
         self.data.setdefault("finance", []).append(entry)
+        if entry_type == "Income":
+            self._income_total += amount
+        else:
+            self._expense_total += amount
         self._insert_finance_row(entry)
         self._update_finance_summary()
 
         self.finance_amount.delete(0, tk.END)
         self.finance_note.delete(0, tk.END)
-        self._save_data()
+        self._schedule_save("finance", appended=entry)
+
+    def _finance_row_values(self, entry: Dict[str, Any]) -> Tuple[str, ...]:
+        display_amount = entry.get("_display_amount")
+        if display_amount is None:
+            sign = "-$" if entry["entry_type"] == "Expense" else "$"
+            display_amount = entry["_display_amount"] = f"{sign}{entry['amount']:.2f}"
+        return (entry["created_at"], entry["entry_type"], display_amount, entry["category"], entry["note"])
 
     def _insert_finance_row(self, entry: Dict[str, Any]) -> None:
-        display_amount = f"${entry['amount']:.2f}"
-        if entry["entry_type"].lower() == "expense":
-            display_amount = f"-${entry['amount']:.2f}"
-        self.finance_tree.insert(
-            "",
-            tk.END,
-            values=(entry["created_at"], entry["entry_type"], display_amount, entry["category"], entry["note"]),
-        )
+        self.finance_tree.insert("", tk.END, values=self._finance_row_values(entry))
 
     def _update_finance_summary(self) -> None:
-        income = sum(entry["amount"] for entry in self.data.get("finance", []) if entry["entry_type"] == "Income")
-        expenses = sum(
-            entry["amount"] for entry in self.data.get("finance", []) if entry["entry_type"].lower() == "expense"
-        )
+        income = self._income_total
+        expenses = self._expense_total
         balance = income - expenses
         summary = f"Income: ${income:.2f}   Expenses: ${expenses:.2f}   Balance: ${balance:.2f}"
         self.finance_summary.configure(text=summary)
@@ -382,10 +808,7 @@ class SDALocalApp(tk.Tk):
     # ------------------------------------------------------------------
     # Media and chat tab
     # ------------------------------------------------------------------
-    def _build_media_tab(self) -> None:
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Media & Chat")
-
+    def _build_media_tab(self, tab: ttk.Frame) -> None:
         media_frame = ttk.LabelFrame(tab, text="Video Broadcast")
         media_frame.pack(fill=tk.X, padx=10, pady=10)
 
@@ -410,8 +833,15 @@ class SDALocalApp(tk.Tk):
         self.chat_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
         ttk.Button(entry_frame, text="Send", command=self._send_chat_message).pack(side=tk.RIGHT)
 
-        for message in self.data.get("chat", []):
-            self._append_chat(message["sender"], message["message"], save=False)
+        history = "".join(
+            f"[{message['timestamp']}] {message['sender']}: {message['message']}\n"
+            for message in self.data.get("chat", [])
+        )
+        if history:
+            self.chat_display.configure(state=tk.NORMAL)
+            self.chat_display.insert(tk.END, history)
+            self.chat_display.configure(state=tk.DISABLED)
+            self.chat_display.see(tk.END)
 
     def _open_video(self) -> None:
         url = self.video_entry.get().strip()
@@ -428,23 +858,21 @@ class SDALocalApp(tk.Tk):
         self.chat_entry.delete(0, tk.END)
         self.after(300, lambda: self._append_chat("Auto-reply", "Message received. We'll follow up soon!"))
 
-    def _append_chat(self, sender: str, message: str, save: bool = True) -> None:
+    def _append_chat(self, sender: str, message: str) -> None:
         timestamp = datetime.now().strftime("%H:%M")
         self.chat_display.configure(state=tk.NORMAL)
         self.chat_display.insert(tk.END, f"[{timestamp}] {sender}: {message}\n")
         self.chat_display.configure(state=tk.DISABLED)
         self.chat_display.see(tk.END)
-        if save:
-            self.data.setdefault("chat", []).append({"sender": sender, "message": message, "timestamp": timestamp})
-            self._save_data()
+        entry = {"sender": sender, "message": message, "timestamp": timestamp}
+        self.data.setdefault("chat", []).append(entry)
+        with CHAT_FILE.open("ab") as chat_file:
+            chat_file.write(_encode_chat_line(entry))
 
     # ------------------------------------------------------------------
     # Projects tab
     # ------------------------------------------------------------------
-    def _build_projects_tab(self) -> None:
-        tab = ttk.Frame(self.notebook)
-        self.notebook.add(tab, text="Building Projects")
-
+    def _build_projects_tab(self, tab: ttk.Frame) -> None:
         form_frame = ttk.LabelFrame(tab, text="Project Details")
         form_frame.pack(fill=tk.X, padx=10, pady=10)
 
@@ -458,7 +886,7 @@ class SDALocalApp(tk.Tk):
 
         ttk.Label(form_frame, text="Start Date").grid(row=1, column=0, padx=5, pady=5, sticky=tk.W)
         self.project_start = ttk.Entry(form_frame)
-        self.project_start.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.project_start.insert(0, self._today())
         self.project_start.grid(row=1, column=1, padx=5, pady=5, sticky=tk.EW)
 
         ttk.Label(form_frame, text="End Date").grid(row=1, column=2, padx=5, pady=5, sticky=tk.W)
@@ -506,8 +934,10 @@ class SDALocalApp(tk.Tk):
         self.project_details.pack(fill=tk.X, padx=5, pady=5)
         self.projects_tree.bind("<<TreeviewSelect>>", self._show_project_details)
 
-        for project in self.data.get("projects", []):
-            self._insert_project_row(project)
+        self._populate_tree(
+            self.projects_tree,
+            [(project["name"], self._project_row_values(project)) for project in self.data.get("projects", [])],
+        )
 
     def _add_project(self) -> None:
         name = self.project_name.get().strip()
@@ -528,20 +958,23 @@ class SDALocalApp(tk.Tk):
             messagebox.showerror("Invalid budget", "Budget must be a number.")
             return
 
-        project = asdict(
-            Project(
-                name=name,
-                manager=manager,
-                start_date=start_date,
-                end_date=end_date,
-                budget=budget,
-                status=status,
-                description=description,
-            )
-        )
+        if not math.isfinite(budget):
+            messagebox.showerror("Invalid budget", "Budget must be a number.")
+            return
+
+        project = Project(
+            name=name,
+            manager=manager,
+            start_date=start_date,
+            end_date=end_date,
+            budget=budget,
+            status=status,
+            description=description,
+        ).to_dict()
         self.data.setdefault("projects", []).append(project)
+        self._projects_by_name[project["name"]] = project
         self._insert_project_row(project)
-        self._save_data()
+        self._schedule_save("projects", appended=project)
 
         self.project_name.delete(0, tk.END)
         self.project_manager.delete(0, tk.END)
@@ -550,28 +983,32 @@ class SDALocalApp(tk.Tk):
         self.project_budget.delete(0, tk.END)
         self.project_description.delete("1.0", tk.END)
         self.project_status.current(0)
-        self.project_start.insert(0, datetime.now().strftime("%Y-%m-%d"))
+        self.project_start.insert(0, self._today())
 
-    def _insert_project_row(self, project: Dict[str, Any]) -> None:
-        self.projects_tree.insert(
-            "",
-            tk.END,
-            iid=project["name"],
-            values=(
-                project["name"],
-                project["status"],
-                project["start_date"],
-                project.get("end_date", ""),
-                f"${project['budget']:.2f}",
-            ),
+    def _project_row_values(self, project: Dict[str, Any]) -> Tuple[str, ...]:
+        return (
+            project["name"],
+            project["status"],
+            project["start_date"],
+            project.get("end_date", ""),
+            self._display_budget(project),
         )
 
+    def _display_budget(self, project: Dict[str, Any]) -> str:
+        display_budget = project.get("_display_budget")
+        if display_budget is None:
+            display_budget = project["_display_budget"] = f"${project['budget']:.2f}"
+        return display_budget
+
+    def _insert_project_row(self, project: Dict[str, Any]) -> None:
+        self.projects_tree.insert("", tk.END, iid=project["name"], values=self._project_row_values(project))
+
     def _show_project_details(self, _: tk.Event) -> None:
         selected = self.projects_tree.selection()
         if not selected:
             return
         iid = selected[0]
-        project = next((p for p in self.data.get("projects", []) if p["name"] == iid), None)
+        project = self._projects_by_name.get(iid)
         if not project:
             return
         self.project_details.configure(state=tk.NORMAL)
@@ -580,7 +1017,7 @@ class SDALocalApp(tk.Tk):
             f"Project: {project['name']}\n"
             f"Manager: {project['manager']}\n"
             f"Timeline: {project['start_date']} - {project.get('end_date', '')}\n"
-            f"Budget: ${project['budget']:.2f}\n"
+            f"Budget: {self._display_budget(project)}\n"
             f"Status: {project['status']}\n\n"
             f"{project['description']}"
         )
@@ -593,20 +1030,14 @@ class SDALocalApp(tk.Tk):
             messagebox.showinfo("No selection", "Select a project to update.")
             return
         iid = selected[0]
-        project = next((p for p in self.data.get("projects", []) if p["name"] == iid), None)
+        project = self._projects_by_name.get(iid)
         if not project:
             messagebox.showerror("Missing project", "Selected project could not be found.")
             return
         new_status = self.project_status.get()
         project["status"] = new_status
-        self.projects_tree.item(iid, values=(
-            project["name"],
-            project["status"],
-            project["start_date"],
-            project.get("end_date", ""),
-            f"${project['budget']:.2f}",
-        ))
-        self._save_data()
+        self.projects_tree.item(iid, values=self._project_row_values(project))
+        self._schedule_save("projects")
         self._show_project_details(None)
 
     def _delete_project(self) -> None:
@@ -618,11 +1049,13 @@ class SDALocalApp(tk.Tk):
         if not messagebox.askyesno("Confirm delete", "Are you sure you want to remove this project?"):
             return
         self.projects_tree.delete(iid)
-        self.data["projects"] = [p for p in self.data.get("projects", []) if p["name"] != iid]
+        project = self._projects_by_name.pop(iid, None)
+        if project is not None:
+            self.data["projects"].remove(project)
         self.project_details.configure(state=tk.NORMAL)
         self.project_details.delete("1.0", tk.END)
         self.project_details.configure(state=tk.DISABLED)
-        self._save_data()
+        self._schedule_save("projects")
 
 
     def _create_menubar(self) -> None:
@@ -639,139 +1072,65 @@ class SDALocalApp(tk.Tk):
 
     def _register_text_widget(self, widget: tk.Text) -> None:
         self._text_widgets.append(widget)
+        if self._current_theme is not None:
+            # Tabs built after the theme was applied still need styling.
+            self._style_text_widget(widget, self._current_theme)
 
-    def _style_text_widget(self, widget: tk.Text, palette: Dict[str, str]) -> None:
-        widget.configure(
-            bg=palette["input"],
-            fg=palette["input_fg"],
-            insertbackground=palette["input_fg"],
-            highlightbackground=palette["border"],
-            highlightcolor=palette["border"],
-            selectbackground=palette["accent"],
-            selectforeground=palette["foreground"],
-        )
+    def _style_text_widget(self, widget: tk.Text, theme_name: str) -> None:
+        widget.configure(**self._text_widget_options[theme_name])
 
     def _apply_theme(self) -> None:
-        palette = self._dark_palette if self.dark_mode.get() else self._light_palette
         theme_name = "sdalocal-dark" if self.dark_mode.get() else "sdalocal-light"
+        if theme_name == self._current_theme:
+            return
+        palette = PALETTES[theme_name]
+        self._palette_version += 1
 
         self.style.theme_use(theme_name)
 
-        self.configure(bg=palette["background"])
-        self.tk_setPalette(
-            background=palette["frame"],
-            foreground=palette["foreground"],
-            activeBackground=palette["accent"],
-            activeForeground=palette["foreground"],
-            highlightColor=palette["border"],
-            selectBackground=palette["accent"],
-            selectForeground=palette["foreground"],
-            insertBackground=palette["input_fg"],
-        )
+        self.configure(bg=palette.background)
+        # tk_setPalette must run on every switch: it recolours ttk labels and
+        # combobox popdowns and writes class-specific option database entries
+        # that a plain option_add cannot override.
+        self.tk_setPalette(**self._palette_options[theme_name])
 
         for text_widget in self._text_widgets:
-            self._style_text_widget(text_widget, palette)
+            self._style_text_widget(text_widget, theme_name)
 
         if hasattr(self, "_menubar"):
-            self._style_menu(self._menubar, palette)
+            self._style_menu(self._menubar, theme_name)
+        self._current_theme = theme_name
 
     def _toggle_dark_mode(self) -> None:
         self._apply_theme()
 
     def _setup_custom_themes(self) -> None:
-        base_theme = "clam" if "clam" in self.style.theme_names() else self.style.theme_use()
-        for theme_name, palette in (
-            ("sdalocal-light", self._light_palette),
-            ("sdalocal-dark", self._dark_palette),
-        ):
-            if theme_name in self.style.theme_names():
+        existing_themes = set(self.style.theme_names())
+        base_theme = "clam" if "clam" in existing_themes else self.style.theme_use()
+        for theme_name, settings in self._compiled_styles.items():
+            if theme_name in existing_themes:
                 self.style.theme_delete(theme_name)
-            self.style.theme_create(
-                theme_name,
-                parent=base_theme,
-                settings={
-                    "TFrame": {"configure": {"background": palette["frame"], "foreground": palette["foreground"]}},
-                    "TLabelframe": {"configure": {"background": palette["frame"], "foreground": palette["foreground"], "bordercolor": palette["border"]}},
-                    "TLabelframe.Label": {"configure": {"background": palette["frame"], "foreground": palette["foreground"]}},
-                    "TLabel": {"configure": {"background": palette["frame"], "foreground": palette["foreground"]}},
-                    "TButton": {
-                        "configure": {"background": palette["frame"], "foreground": palette["foreground"]},
-                        "map": {
-                            "background": [("active", palette["accent"])],
-                            "foreground": [("active", palette["foreground"])],
-                        },
-                    },
-                    "TNotebook": {"configure": {"background": palette["background"], "bordercolor": palette["border"]}},
-                    "TNotebook.Tab": {
-                        "configure": {
-                            "background": palette["frame"],
-                            "foreground": palette["foreground"],
-                            "padding": (10, 5),
-                        },
-                        "map": {
-                            "background": [("selected", palette["accent"])],
-                            "foreground": [("selected", palette["foreground"])],
-                        },
-                    },
-                    "TEntry": {
-                        "configure": {
-                            "fieldbackground": palette["input"],
-                            "foreground": palette["input_fg"],
-                            "background": palette["frame"],
-                            "insertcolor": palette["input_fg"],
-                        }
-                    },
-                    "TCombobox": {
-                        "configure": {
-                            "fieldbackground": palette["input"],
-                            "foreground": palette["input_fg"],
-                            "background": palette["frame"],
-                        },
-                        "map": {
-                            "fieldbackground": [
-                                ("readonly", palette["input"]),
-                                ("!disabled", palette["input"]),
-                            ],
-                            "foreground": [
-                                ("readonly", palette["input_fg"]),
-                                ("!disabled", palette["input_fg"]),
-                            ],
-                        },
-                    },
-                    "Treeview": {
-                        "configure": {
-                            "background": palette["tree_background"],
-                            "fieldbackground": palette["tree_field"],
-                            "foreground": palette["tree_foreground"],
-                            "bordercolor": palette["border"],
-                        },
-                        "map": {
-                            "background": [("selected", palette["accent"])],
-                            "foreground": [("selected", palette["foreground"])],
-                        },
-                    },
-                    "Treeview.Heading": {
-                        "configure": {"background": palette["frame"], "foreground": palette["foreground"]}
-                    },
-                },
-            )
-
-    def _style_menu(self, menu: tk.Menu, palette: Dict[str, str]) -> None:
-        menu.configure(
-            background=palette["frame"],
-            foreground=palette["foreground"],
-            activebackground=palette["accent"],
-            activeforeground=palette["foreground"],
-            bd=0,
-            relief=tk.FLAT,
-        )
-        last_index = menu.index("end")
-        if last_index is None:
-            return
-        for index in range(last_index + 1):
-            if menu.type(index) == "cascade":
-                submenu = menu.nametowidget(menu.entrycget(index, "menu"))
-                self._style_menu(submenu, palette)
+            self.style.theme_create(theme_name, parent=base_theme, settings=settings)
+
+    def _style_menu(self, menu: tk.Menu, theme_name: str) -> None:
+        """Style ``menu`` and every cascade below it with ``theme_name``'s palette."""
+
+        options = self._menu_options[theme_name]
+        version = self._palette_version
+        call = menu.tk.call
+        splitlist = menu.tk.splitlist
+        pending = deque([menu])
+        while pending:
+            current = pending.popleft()
+            # A menu already stamped with this palette version was styled
+            # earlier in this pass, along with its cascades; skipping it also
+            # stops shared or cyclic cascades from being queued again.
+            if self._styled_menus.get(current) == version:
+                continue
+            cascades = splitlist(call("apply", _MENU_STYLE, current._w, options))
+            self._styled_menus[current] = version
+            for path in cascades:
+                pending.append(current.nametowidget(str(path)))
 
 def main() -> None:
     """Launch the sdaLocal desktop application."""